@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import csv
+import math
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 import pdfplumber
-from pdfplumber.utils import cluster_objects
 
 PDF_NAME = 'AG Taylor Calendar - September 2023.pdf'
 OUTPUT_NAME = 'ag_taylor_calendar_sept_2023.csv'
@@ -14,7 +19,15 @@ OUTPUT_NAME = 'ag_taylor_calendar_sept_2023.csv'
 DATE_PATTERN = re.compile(r'([A-Za-z]+ \d{1,2}, \d{4})')
 DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 DAY_NAMES_UPPER = {name.upper() for name in DAY_NAMES}
+DAY_INITIALS = frozenset(name[0] for name in DAY_NAMES_UPPER)
 DIGITS_ONLY_PATTERN = re.compile(r'^[0-9]+$')
+PERSON_NAME_PATTERN = re.compile(r'[A-Z][a-z]+(?: [A-Z][a-z]+){0,2}(?: [A-Z]\.)?(?: \(.+\))?')
+PERSON_COMMA_PATTERN = re.compile(r'[A-Z][a-z]+,\s+[A-Z]')
+TIME_COLON_PATTERN = re.compile(r'^\d{1,2}[:.]\d{2}')
+TIME_AMPM_PATTERN = re.compile(r'^\d{1,2}\s?(AM|PM)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+WORD_EXTRA_ATTRS = ('fontname',)
 
 TIME_COLUMN_X_THRESHOLD = 70
 LINE_CLUSTER_TOLERANCE = 3
@@ -42,8 +55,12 @@ SPECIAL_SPLIT_MARKERS = [
     "CHIEF'S CONFERENCE",
     "CHIEFS CONFERENCE",
 ]
+SPECIAL_SPLIT_PATTERNS = tuple(
+    re.compile(r'\s+' + re.escape(marker), flags=re.IGNORECASE) for marker in SPECIAL_SPLIT_MARKERS
+)
+TRAILING_SPLIT_PATTERN = re.compile('|'.join(re.escape(prefix) for prefix in ['PH:', *SPECIAL_SPLIT_MARKERS]))
 
-LOCATION_HINTS = {
+LOCATION_HINTS = frozenset({
     'MICROSOFT TEAMS',
     'IN PERSON',
     'TELECONFERENCE',
@@ -63,7 +80,7 @@ LOCATION_HINTS = {
     'PALMER',
     'FAIRBANKS',
     'TEAMS',
-}
+})
 
 FORCED_EVENT_PREFIXES = (
     'CHECK IN',
@@ -74,8 +91,19 @@ FORCED_EVENT_PREFIXES = (
     'UPDATE',
     "CHIEF'S CONFERENCE",
 )
+FORCED_EVENT_PREFIX_PATTERN = re.compile('|'.join(re.escape(prefix) for prefix in FORCED_EVENT_PREFIXES))
+
+FORCED_EVENT_KEYWORDS = frozenset({
+    'MTG:',
+    'HEARING',
+    'BRIEFING',
+    'INTERVIEW',
+    'DEFENSE',
+    'REVIEW',
+    'PRESS CONFERENCE',
+})
 
-PERSON_HINTS = {
+PERSON_HINTS = frozenset({
     'GOV)',
     'LAW)',
     'DNR)',
@@ -86,25 +114,70 @@ PERSON_HINTS = {
     'EDU)',
     'JUD)',
     'LEG)',
-}
+})
+
+NON_PERSON_KEYWORDS = frozenset({
+    'STATEHOOD',
+    'DEFENSE',
+    'MEETING',
+    'CONFERENCE',
+    'CABINET',
+    'BRIEFING',
+})
+
+
+def compile_hint_pattern(hints: frozenset[str]) -> re.Pattern[str]:
+    # A hint that contains a shorter hint can never decide a substring search, so leave it out.
+    minimal = sorted(hint for hint in hints if not any(other != hint and other in hint for other in hints))
+    return re.compile('|'.join(re.escape(hint) for hint in minimal))
+
+
+LOCATION_HINTS_PATTERN = compile_hint_pattern(LOCATION_HINTS)
+PERSON_HINTS_PATTERN = compile_hint_pattern(PERSON_HINTS)
+FORCED_EVENT_KEYWORDS_PATTERN = compile_hint_pattern(FORCED_EVENT_KEYWORDS)
+NON_PERSON_KEYWORDS_PATTERN = compile_hint_pattern(NON_PERSON_KEYWORDS)
+
+
+class Line(NamedTuple):
+    text: str
+    x0: float
+    words: tuple[dict, ...]
+
+
+class Segment(NamedTuple):
+    text: str
+    upper: str
+    is_person: bool
+    is_location: bool
+
+
+def cluster_words_by_top(words):
+    clusters = []
+    previous_top = None
+    for word in sorted(words, key=itemgetter('top')):
+        top = word['top']
+        if previous_top is None or top > previous_top + LINE_CLUSTER_TOLERANCE:
+            clusters.append([])
+        clusters[-1].append(word)
+        previous_top = top
+    return clusters
 
 
 def build_lines(words):
-    clusters = cluster_objects(words, 'top', tolerance=LINE_CLUSTER_TOLERANCE)
     lines = []
-    for cluster in clusters:
-        cluster_sorted = sorted(cluster, key=lambda w: w['x0'])
-        text = ' '.join(word['text'] for word in cluster_sorted).strip()
+    for cluster_sorted in cluster_words_by_top(words):
+        cluster_sorted.sort(key=itemgetter('x0'))
+        text = ' '.join([word['text'] for word in cluster_sorted]).strip()
         if not text:
             continue
-        x0 = min(word['x0'] for word in cluster_sorted)
-        lines.append({'text': text, 'x0': x0, 'words': cluster_sorted})
+        x0 = cluster_sorted[0]['x0']
+        lines.append(Line(text, x0, tuple(cluster_sorted)))
     return lines
 
 
 def extract_date(lines):
     for line in lines:
-        match = DATE_PATTERN.search(line['text'])
+        match = DATE_PATTERN.search(line.text)
         if match:
             try:
                 return datetime.strptime(match.group(1), '%B %d, %Y').date()
@@ -113,99 +186,110 @@ def extract_date(lines):
     return None
 
 
+def is_day_name(text: str) -> bool:
+    return text[:1].upper() in DAY_INITIALS and text.upper() in DAY_NAMES_UPPER
+
+
 def find_day_line_index(lines):
     for idx, line in enumerate(lines):
-        if line['text'].strip().upper() in DAY_NAMES_UPPER:
+        if is_day_name(line.text.strip()):
             return idx
     return None
 
 
-def split_event_text(event_text: str) -> list[str]:
+def split_event_text(event_text: str) -> list[Segment]:
     if not event_text:
         return []
     normalized = event_text.replace(' PH:', ';PH:')
-    for marker in SPECIAL_SPLIT_MARKERS:
-        pattern = re.compile(r'\s+' + re.escape(marker), flags=re.IGNORECASE)
+    for pattern in SPECIAL_SPLIT_PATTERNS:
         normalized = pattern.sub(lambda m: '; ' + m.group(0).strip(), normalized)
     parts = [part.strip() for part in normalized.split(';')]
-    return [part for part in parts if part and part.upper() not in NOISE_SEGMENTS]
+    segments = [classify_segment(part) for part in parts if part]
+    return [segment for segment in segments if segment.upper not in NOISE_SEGMENTS]
 
 
 def segment_has_digits(text: str) -> bool:
     return any(ch.isdigit() for ch in text)
 
 
-def should_force_new_event(segment: str, current_segments: list[str]) -> bool:
-    cleaned = segment.strip()
+def should_force_new_event(segment: Segment, current_segments: list[Segment]) -> bool:
+    cleaned = segment.text
     if not cleaned:
         return False
-    upper = cleaned.upper()
+    upper = segment.upper
     if upper.startswith('PH:'):
         return False
     if 'TELECONFERENCE' in upper:
         return False
-    if is_location_segment(segment):
+    if segment.is_location:
         return False
-    if re.fullmatch(r'[A-Z][a-z]+(?: [A-Z][a-z]+){0,2}(?: [A-Z]\.)?(?: \(.+\))?', cleaned):
+    if PERSON_NAME_PATTERN.fullmatch(cleaned):
         return True
-    if any(hint in upper for hint in PERSON_HINTS):
+    if PERSON_HINTS_PATTERN.search(upper):
         return False
-    if re.match(r'^\d{1,2}[:.]\d{2}', cleaned):
+    if TIME_COLON_PATTERN.match(cleaned):
         return True
-    if re.match(r'^\d{1,2}\s?(AM|PM)', upper):
+    if TIME_AMPM_PATTERN.match(upper):
         return True
-    if any(upper.startswith(prefix) for prefix in FORCED_EVENT_PREFIXES):
+    if FORCED_EVENT_PREFIX_PATTERN.match(upper):
+        return True
+    if FORCED_EVENT_KEYWORDS_PATTERN.search(upper) and LOCATION_HINTS_PATTERN.search(upper) is None:
         return True
-    if any(keyword in upper for keyword in ('MTG:', 'HEARING', 'BRIEFING', 'INTERVIEW', 'DEFENSE', 'REVIEW', 'PRESS CONFERENCE')):
-        if not any(hint in upper for hint in LOCATION_HINTS):
-            return True
-        words = [w for w in cleaned.split() if w]
-        capitalized = sum(1 for w in words if w[0].isalpha() and w[0].isupper())
-        if 1 < len(words) <= 8 and capitalized >= len(words) - 1:
-            if not any(hint in upper for hint in LOCATION_HINTS):
-                return True
     return False
 
 
 
 
-def is_bold_word(word: dict) -> bool:
-    font_name = (word.get('fontname') or '').upper()
+@lru_cache(maxsize=None)
+def is_bold_font(font_name: str) -> bool:
+    font_name = font_name.upper()
     return 'BOLD' in font_name or 'BD' in font_name or 'BLACK' in font_name
 
 
+def is_bold_word(word: dict) -> bool:
+    return is_bold_font(word.get('fontname') or '')
+
+
 
 
 
 def merge_events(lines, start_index):
     events: list[list[str]] = []
-    current_segments: list[str] = []
+    current_segments: list[Segment] = []
     pending_new_event = True
     current_event_x0: float | None = None
-    pending_location_segments: list[str] = []
+    pending_location_segments: list[Segment] = []
+    split_index: int | None = None
+
+    def extend_current(new_segments: list[Segment]) -> None:
+        nonlocal split_index
+        for segment in new_segments:
+            if split_index is None and current_segments and TRAILING_SPLIT_PATTERN.match(segment.upper):
+                split_index = len(current_segments)
+            current_segments.append(segment)
 
     def flush_current() -> None:
-        nonlocal current_segments, pending_new_event, current_event_x0
+        nonlocal current_segments, pending_new_event, current_event_x0, split_index
         if current_segments:
-            events.append(current_segments.copy())
+            events.append([segment.text for segment in current_segments])
         current_segments = []
         pending_new_event = True
         current_event_x0 = None
+        split_index = None
 
     for line in lines[start_index:]:
-        text = line['text'].strip()
+        text = line.text.strip()
         if not text:
             continue
-        upper_text = text.upper()
-        if upper_text in DAY_NAMES_UPPER:
+        if is_day_name(text):
             break
         if DATE_PATTERN.search(text):
             break
-        if DIGITS_ONLY_PATTERN.fullmatch(text) and line['x0'] > 200:
+        if DIGITS_ONLY_PATTERN.fullmatch(text) and line.x0 > 200:
             break
 
-        time_words = [word for word in line['words'] if word['x0'] <= TIME_COLUMN_X_THRESHOLD]
-        event_words = [word for word in line['words'] if word['x0'] > TIME_COLUMN_X_THRESHOLD]
+        time_words = [word for word in line.words if word['x0'] <= TIME_COLUMN_X_THRESHOLD]
+        event_words = [word for word in line.words if word['x0'] > TIME_COLUMN_X_THRESHOLD]
         event_text = ' '.join(word['text'] for word in event_words).strip()
         segments = split_event_text(event_text)
 
@@ -213,17 +297,17 @@ def merge_events(lines, start_index):
         line_is_bold = any(is_bold_word(word) for word in event_words[:3])
 
         if time_words:
-            if segments and not pending_new_event and current_segments and all(is_person_segment(seg) for seg in segments):
-                current_segments.extend(segments)
+            if segments and not pending_new_event and current_segments and all(seg.is_person for seg in segments):
+                extend_current(segments)
                 if event_x0 is not None and current_event_x0 is None:
                     current_event_x0 = event_x0
                 continue
             flush_current()
             if pending_location_segments:
-                current_segments.extend(pending_location_segments)
+                extend_current(pending_location_segments)
                 pending_location_segments.clear()
             if segments:
-                current_segments.extend(segments)
+                extend_current(segments)
                 pending_new_event = False
                 current_event_x0 = event_x0
             else:
@@ -234,17 +318,17 @@ def merge_events(lines, start_index):
         if not segments:
             continue
 
-        all_person = all(is_person_segment(seg) for seg in segments)
-        all_location = all(is_location_segment(seg) for seg in segments)
+        all_person = all(seg.is_person for seg in segments)
+        all_location = all(seg.is_location for seg in segments)
 
         if all_location and current_segments:
-            current_segments.extend(segments)
+            extend_current(segments)
             if event_x0 is not None and current_event_x0 is None:
                 current_event_x0 = event_x0
             continue
 
         if all_person and current_segments:
-            current_segments.extend(segments)
+            extend_current(segments)
             continue
 
         if all_location and not current_segments:
@@ -266,36 +350,28 @@ def merge_events(lines, start_index):
                 forced_new = True
             elif not all_person and should_force_new_event(primary_segment, current_segments):
                 forced_new = True
-            elif line_is_bold and not all_person and not is_location_segment(primary_segment):
+            elif line_is_bold and not all_person and not primary_segment.is_location:
                 forced_new = True
 
         if forced_new:
             flush_current()
             if pending_location_segments:
-                current_segments.extend(pending_location_segments)
+                extend_current(pending_location_segments)
                 pending_location_segments.clear()
 
         if pending_new_event and not current_segments:
             pending_new_event = False
 
         if not current_segments and pending_location_segments:
-            current_segments.extend(pending_location_segments)
+            extend_current(pending_location_segments)
             pending_location_segments.clear()
 
-        current_segments.extend(segments)
-        split_index = None
-        for idx, seg in enumerate(current_segments):
-            if idx == 0:
-                continue
-            upper_seg = seg.upper()
-            if upper_seg.startswith('PH:') or any(upper_seg.startswith(marker) for marker in SPECIAL_SPLIT_MARKERS):
-                split_index = idx
-                break
+        extend_current(segments)
         if split_index is not None:
             trailing = current_segments[split_index:]
             current_segments = current_segments[:split_index]
             flush_current()
-            current_segments.extend(trailing)
+            extend_current(trailing)
             pending_new_event = False
             if event_x0 is not None:
                 current_event_x0 = event_x0
@@ -308,9 +384,9 @@ def merge_events(lines, start_index):
 
     if pending_location_segments:
         if current_segments:
-            current_segments.extend(pending_location_segments)
+            extend_current(pending_location_segments)
         elif events:
-            events[-1].extend(pending_location_segments)
+            events[-1].extend(segment.text for segment in pending_location_segments)
         pending_location_segments.clear()
 
     flush_current()
@@ -325,90 +401,93 @@ def clean_meeting_place(text: str) -> str:
     return cleaned
 
 
-def is_location_segment(segment: str) -> bool:
+def classify_segment(segment: str) -> Segment:
     cleaned = segment.strip()
-    if not cleaned:
-        return False
     upper = cleaned.upper()
+    if not cleaned:
+        return Segment(cleaned, upper, False, False)
+    is_location = is_location_upper(upper)
+    is_person = is_person_upper(cleaned, upper, is_location)
+    return Segment(cleaned, upper, is_person, is_location)
+
+
+def is_location_segment(segment: str) -> bool:
+    return classify_segment(segment).is_location
+
+
+def is_person_segment(segment: str) -> bool:
+    return classify_segment(segment).is_person
+
+
+def is_location_upper(upper: str) -> bool:
     if 'TELECONFERENCE' in upper:
         return True
     if "CHIEF'S CONFERENCE" in upper:
         return False
     if 'CONFERENCE' in upper and 'ROOM' not in upper and 'CENTER' not in upper and 'CALL' not in upper and 'LINE' not in upper:
         return False
-    return any(hint in upper for hint in LOCATION_HINTS)
+    return LOCATION_HINTS_PATTERN.search(upper) is not None
 
 
-def is_person_segment(segment: str) -> bool:
-    cleaned = segment.strip()
-    if not cleaned:
-        return False
-    upper = cleaned.upper()
+def is_person_upper(cleaned: str, upper: str, is_location: bool) -> bool:
     if upper.startswith('PH:'):
         return False
     if 'TELECONFERENCE' in upper:
         return False
-    if is_location_segment(segment):
+    if is_location:
         return False
     if upper.startswith('MTG:'):
         return False
-    if any(keyword in upper for keyword in ('STATEHOOD', 'DEFENSE', 'MEETING', 'CONFERENCE', 'CABINET', 'BRIEFING')):
+    if NON_PERSON_KEYWORDS_PATTERN.search(upper):
         return False
     if ',' in cleaned and not segment_has_digits(cleaned):
         parts = [part.strip() for part in cleaned.split(',') if part.strip()]
         if parts and any(part[0].isalpha() for part in parts):
             return True
-    if re.fullmatch(r'[A-Z][a-z]+(?: [A-Z][a-z]+){0,2}(?: [A-Z]\.)?(?: \(.+\))?', cleaned):
+    if PERSON_NAME_PATTERN.fullmatch(cleaned):
         return True
-    return any(hint in upper for hint in PERSON_HINTS)
+    return PERSON_HINTS_PATTERN.search(upper) is not None
+
+
 
+def normalize_for_compare(value: str) -> str:
+    return WHITESPACE_PATTERN.sub(' ', value.upper()).strip(' ;')
 
 
 def format_event_segments(segments: list[str]) -> tuple[str, str, str]:
     if not segments:
         return '', '', ''
 
-    field1 = segments[0].strip()
+    field1_parts = [segments[0].strip()]
+    field_norm = normalize_for_compare(field1_parts[0])
     rest_raw = [seg.strip() for seg in segments[1:] if seg and seg.strip()]
 
-    def normalize_for_compare(value: str) -> str:
-        return re.sub(r'\s+', ' ', value.upper()).strip(' ;')
-
-    def should_skip_segment(value: str) -> bool:
-        upper = value.upper().strip(' ;')
-        field_norm = normalize_for_compare(field1)
-        return upper == field_norm or field_norm.endswith(upper)
-
-    processed_rest: list[str] = []
+    meeting_parts: list[str] = []
+    person_parts: list[str] = []
     for segment in rest_raw:
         if not segment:
             continue
         if segment.upper().startswith('PH:'):
-            field1 = f"{field1} {segment}".strip()
+            field1_parts.append(segment)
+            field_norm = normalize_for_compare(' '.join(field1_parts))
             continue
-        if should_skip_segment(segment):
+        segment_norm = segment.upper().strip(' ;')
+        if segment_norm == field_norm or field_norm.endswith(segment_norm):
             continue
-        match = re.search(r'[A-Z][a-z]+,\s+[A-Z]', segment)
+        match = PERSON_COMMA_PATTERN.search(segment)
         if match and match.start() > 0:
-            before = segment[: match.start()].strip(' ;')
-            after = segment[match.start():].strip()
-            if before:
-                processed_rest.append(before)
-            if after:
-                processed_rest.append(after)
+            parts = (segment[: match.start()].strip(' ;'), segment[match.start():].strip())
         else:
-            processed_rest.append(segment)
-
-    meeting_parts: list[str] = []
-    person_parts: list[str] = []
+            parts = (segment,)
+        for part in parts:
+            if not part:
+                continue
+            if is_person_segment(part):
+                person_parts.append(part)
+            else:
+                meeting_parts.append(part)
 
-    for segment in processed_rest:
-        if not segment:
-            continue
-        if is_person_segment(segment):
-            person_parts.append(segment)
-        else:
-            meeting_parts.append(segment)
+    field1 = ' '.join(field1_parts).strip()
 
     field_upper = field1.upper()
     if 'PH: INTERVIEW' in field_upper:
@@ -430,32 +509,67 @@ def format_event_segments(segments: list[str]) -> tuple[str, str, str]:
     return field1, meeting_place, person
 
 
-def extract_events(pdf_path: Path):
-    with pdfplumber.open(str(pdf_path)) as pdf:
+def page_may_have_date(page) -> bool:
+    return any(char['text'].isdigit() for char in page.chars)
+
+
+def extract_page_events(page):
+    if not page_may_have_date(page):
+        return
+    words = page.extract_words(use_text_flow=True, keep_blank_chars=False, extra_attrs=WORD_EXTRA_ATTRS)
+    if not words:
+        return
+    lines = build_lines(words)
+
+    date_obj = extract_date(lines)
+    if not date_obj:
+        return
+
+    day_idx = find_day_line_index(lines)
+    if day_idx is None:
+        return
+
+    schedule_start = day_idx + 2
+    events = merge_events(lines, schedule_start)
+
+    if not events:
+        yield date_obj.isoformat(), '', '', ''
+        return
+
+    for event_segments in events:
+        event_name, meeting_place, person = format_event_segments(event_segments)
+        yield date_obj.isoformat(), event_name, meeting_place, person
+
+
+def extract_events(pdf_source: str | Path | BinaryIO):
+    with pdfplumber.open(pdf_source) as pdf:
         for page in pdf.pages:
-            words = page.extract_words(use_text_flow=True, keep_blank_chars=False, extra_attrs=['fontname'])
-            if not words:
-                continue
-            lines = build_lines(words)
+            yield from extract_page_events(page)
 
-            date_obj = extract_date(lines)
-            if not date_obj:
-                continue
 
-            day_idx = find_day_line_index(lines)
-            if day_idx is None:
-                continue
+def extract_page_range_rows(pdf_path: Path, start: int, stop: int) -> list[tuple[str, str, str, str]]:
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        return [row for page in pdf.pages[start:stop] for row in extract_page_events(page)]
 
-            schedule_start = day_idx + 2
-            events = merge_events(lines, schedule_start)
 
-            if not events:
-                yield date_obj.isoformat(), '', '', ''
-                continue
+def extract_events_parallel(pdf_path: Path, max_workers: int | None = None):
+    max_workers = max_workers or os.cpu_count() or 1
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        page_count = len(pdf.pages)
+    if max_workers < 2 or page_count < 2:
+        yield from extract_events(pdf_path)
+        return
+
+    chunk_size = math.ceil(page_count / max_workers)
+    starts = range(0, page_count, chunk_size)
+    stops = [start + chunk_size for start in starts]
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        for rows in executor.map(extract_page_range_rows, [pdf_path] * len(starts), starts, stops):
+            yield from rows
 
-            for event_segments in events:
-                event_name, meeting_place, person = format_event_segments(event_segments)
-                yield date_obj.isoformat(), event_name, meeting_place, person
+
+def extract_event_rows(pdf_source: str | Path | BinaryIO) -> list[tuple[str, str, str, str]]:
+    return list(extract_events(pdf_source))
 
 
 def main():
@@ -463,15 +577,16 @@ def main():
     if not pdf_path.exists():
         raise SystemExit(f'PDF not found: {pdf_path}')
 
-    rows = list(extract_events(pdf_path))
-
     output_path = Path(OUTPUT_NAME)
+    row_count = 0
     with output_path.open('w', newline='', encoding='utf-8') as csv_file:
         writer = csv.writer(csv_file)
         writer.writerow(['date', 'Event Name', 'Meeting Place', 'Person'])
-        writer.writerows(rows)
+        for row in extract_events_parallel(pdf_path):
+            writer.writerow(row)
+            row_count += 1
 
-    print(f'Wrote {len(rows)} rows to {output_path}')
+    print(f'Wrote {row_count} rows to {output_path}')
 
 
 if __name__ == '__main__':
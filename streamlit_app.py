@@ -1,13 +1,15 @@
 
 import io
+import os
 import zipfile
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
-from parse_calendar import extract_events
+from parse_calendar import extract_event_rows
 
 st.set_page_config(page_title="Calendar Parser", layout="wide")
 st.title("Calendar PDF Parser")
@@ -17,37 +19,41 @@ uploaded_zip = st.file_uploader("Upload ZIP", type=["zip"], help="ZIP archive co
 
 if uploaded_zip is not None:
     with st.spinner("Processing PDFs..."):
-        rows = []
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            with zipfile.ZipFile(io.BytesIO(uploaded_zip.read())) as zf:
-                pdf_members = [member for member in zf.namelist() if member.lower().endswith('.pdf')]
-                if not pdf_members:
-                    st.warning("No PDF files found in the uploaded ZIP archive.")
-                else:
-                    for member in sorted(pdf_members):
-                        if member.endswith('/'):
-                            continue
-                        target_path = tmpdir_path / Path(member).name
-                        with zf.open(member) as source, target_path.open('wb') as target:
-                            target.write(source.read())
-
-                        for date_str, event_name, meeting_place, person in extract_events(target_path):
-                            rows.append({
-                                "date": date_str,
-                                "Event Name": event_name,
-                                "Meeting Place": meeting_place,
-                                "Person": person,
-                                "Source PDF": Path(member).name,
-                            })
-
-        if rows:
-            df = pd.DataFrame(rows)
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df = df.sort_values('date').reset_index(drop=True)
-            df['date'] = df['date'].dt.date
-
-            st.success(f"Parsed {len(rows)} events from {df['Source PDF'].nunique()} PDF(s).")
+        dates, event_names, meeting_places, persons, sources = [], [], [], [], []
+        with zipfile.ZipFile(io.BytesIO(uploaded_zip.read())) as zf:
+            pdf_members = [member for member in zf.namelist() if member.lower().endswith('.pdf')]
+            if not pdf_members:
+                st.warning("No PDF files found in the uploaded ZIP archive.")
+            else:
+                pdf_members = [member for member in sorted(pdf_members) if not member.endswith('/')]
+                pdf_streams = [io.BytesIO(zf.read(member)) for member in pdf_members]
+
+                progress = st.progress(0.0)
+                max_workers = min(len(pdf_streams), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = executor.map(extract_event_rows, pdf_streams)
+                    for done, (member, events) in enumerate(zip(pdf_members, results), start=1):
+                        for date_str, event_name, meeting_place, person in events:
+                            dates.append(date_str)
+                            event_names.append(event_name)
+                            meeting_places.append(meeting_place)
+                            persons.append(person)
+                        sources.extend([Path(member).name] * len(events))
+                        progress.progress(done / len(pdf_members))
+                progress.empty()
+
+        if dates:
+            df = pd.DataFrame({
+                "date": dates,
+                "Event Name": event_names,
+                "Meeting Place": meeting_places,
+                "Person": persons,
+                "Source PDF": sources,
+            })
+            df = df.sort_values('date', kind='mergesort').reset_index(drop=True)
+            df['date'] = df['date'].map(date.fromisoformat)
+
+            st.success(f"Parsed {len(df)} events from {df['Source PDF'].nunique()} PDF(s).")
             st.dataframe(df, use_container_width=True)
 
             csv_buffer = io.StringIO()